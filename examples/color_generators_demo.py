@@ -0,0 +1,60 @@
+"""
+色生成アルゴリズムの使用例
+
+リポジトリのルートで次のように実行します:
+
+    python -m examples.color_generators_demo
+"""
+
+from src.color_generators import (
+    ALTERNATING_GENERATOR,
+    COLOR_WHEEL_GENERATOR,
+    EQUIDISTANT_GENERATOR,
+    FIBONACCI_GENERATOR,
+    GOLDEN_RATIO_GENERATOR,
+    Color,
+)
+
+
+def main():
+    """各色生成アルゴリズムの使用例を表示"""
+    # シンプルな使用例
+    print("=== シンプルな使用例 ===")
+
+    # 抽象クラスを使用した柔軟な設計
+    generators = {
+        "黄金比": GOLDEN_RATIO_GENERATOR,
+        "等間隔": EQUIDISTANT_GENERATOR,
+        "フィボナッチ": FIBONACCI_GENERATOR,
+        "カラーホイール": COLOR_WHEEL_GENERATOR,
+        "交互色生成": ALTERNATING_GENERATOR,
+    }
+
+    for name, generator in generators.items():
+        colors = generator.generate_colors(5)
+        print(f"{name}: {colors}")
+
+    print("\n=== 依存性逆転の原則を体現した使用例 ===")
+
+    # Colorクラスを使用した依存性逆転の例
+    golden_color = Color(GOLDEN_RATIO_GENERATOR)
+    equidistant_color = Color(EQUIDISTANT_GENERATOR)
+    fibonacci_color = Color(FIBONACCI_GENERATOR)
+    color_wheel_color = Color(COLOR_WHEEL_GENERATOR)
+    alternating_color = Color(ALTERNATING_GENERATOR)
+
+    # 同じインターフェースで異なるアルゴリズムを使用
+    print(f"黄金比色: {golden_color.generate(5)}")
+    print(f"等間隔色: {equidistant_color.generate(5)}")
+    print(f"フィボナッチ色: {fibonacci_color.generate(5)}")
+    print(f"カラーホイール色: {color_wheel_color.generate(5)}")
+    print(f"交互色生成: {alternating_color.generate(5)}")
+
+    # パラメータを変更して使用
+    print(f"\n高彩度黄金比色: {golden_color.generate(3, saturation=0.9, lightness=0.5)}")
+    print(f"オフセット等間隔色: {equidistant_color.generate(3, offset=90)}")
+    print(f"交互色生成（10色）: {alternating_color.generate(10)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -58,7 +58,9 @@ function hslToRgb(hue: number, saturation: number, lightness: number): [number,
  * @returns hex形式の色文字列（#RRGGBB形式）
  */
 function rgbToHex(r: number, g: number, b: number): string {
-  return `#${r.toString(16).padStart(2, '0')}${g.toString(16).padStart(2, '0')}${b.toString(16).padStart(2, '0')}`;
+  // 3成分を1つの整数にまとめ、1回の変換で6桁のhex文字列にする
+  // 先頭に1を立てて桁数を7桁に固定し、その1桁を取り除くことで0埋めを省く
+  return `#${((1 << 24) | (r << 16) | (g << 8) | b).toString(16).slice(1)}`;
 }
 
 /**
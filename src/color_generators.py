@@ -8,8 +8,24 @@
 - J. Itten, The Art of Color. [https://www.blinkist.com/en/books/the-art-of-color-en](https://www.blinkist.com/en/books/the-art-of-color-en)
 """
 
+import functools
+import importlib.util
+import itertools
+import operator
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# numbaは任意依存。未インストールの場合は純Pythonで実行する
+# インポートに時間がかかるため、ここでは有無だけを確認し、最初にカーネルを使用する時点で読み込む
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# 生成される色のシーケンス。return_format と as_tuple の指定によって形式が変わる
+_Palette = Union[List[str], Tuple[str, ...], List[Tuple[int, ...]], Tuple[Tuple[int, ...], ...]]
+
+# return_format に指定できる値
+_RETURN_FORMATS = frozenset(("hex", "rgb", "rgba"))
 
 
 class ColorGenerator(ABC):
@@ -63,7 +79,8 @@ class Color:
     コンストラクタで色生成器を渡すことで、柔軟にアルゴリズムを切り替えることができます。
 
     Attributes:
-        _color_generator (ColorGenerator): 設定された色生成器のインスタンス
+        _color_generator (ColorGenerator | Callable): 設定された色生成器のインスタンス、または色生成関数
+        _generate (Callable): 色生成器の generate_colors（バインド済みメソッド）、または色生成関数
 
     Methods:
         generate: 色を生成するメソッド
@@ -75,25 +92,43 @@ class Color:
         ['#ff0000', '#00ff00', '#0000ff', '#ffff00', '#ff00ff']
     """
 
-    def __init__(self, color_generator: ColorGenerator):
+    __slots__ = ("_color_generator", "_generate")
+
+    def __init__(self, color_generator: Union[ColorGenerator, Callable[..., List[str]]]):
         """
         色生成器を設定してColorインスタンスを初期化
 
+        ColorGeneratorを継承していなくても、同じシグネチャの generate_colors
+        メソッドを持つオブジェクトであれば色生成器として使用できます。
+        generate_colors と同じシグネチャの関数を直接渡すこともできます。
+
         Args:
-            color_generator: 色生成アルゴリズムの実装インスタンス
+            color_generator: 色生成アルゴリズムの実装インスタンス、または色生成関数
 
         Raises:
-            TypeError: color_generatorがColorGeneratorのインスタンスでない場合
+            TypeError: color_generatorがクラスの場合、または generate_colors メソッドを持たず、呼び出し可能でもない場合
 
         Example:
             >>> generator = GoldenRatioColorGenerator()
             >>> color = Color(generator)
+            >>> gray_color = Color(lambda n, saturation=0.8, lightness=0.6, offset=0: ["#808080"] * n)
         """
-        if not isinstance(color_generator, ColorGenerator):
-            raise TypeError("color_generatorはColorGeneratorのインスタンスである必要があります")
+        if isinstance(color_generator, type):
+            # クラスはインスタンス化されていないため、generate_colors を呼ぶと self が欠けて失敗する
+            raise TypeError("color_generatorにはクラスではなくインスタンスを指定してください")
+        generate_colors = getattr(color_generator, "generate_colors", None)
+        if not callable(generate_colors):
+            if not callable(color_generator):
+                raise TypeError("color_generatorはgenerate_colorsメソッドを持つか、呼び出し可能である必要があります")
+            # クラスを定義せずに、関数をそのまま色生成器として使用する
+            generate_colors = color_generator
         self._color_generator = color_generator
+        # 呼び出しごとの属性参照を省くため、バインド済みメソッドを保持する
+        self._generate = generate_colors
 
-    def generate(self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0) -> List[str]:
+    def generate(
+        self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0, **options
+    ) -> _Palette:
         """
         設定された色生成器を使用して色を生成
 
@@ -105,9 +140,11 @@ class Color:
             saturation: 彩度（0.0-1.0の範囲、デフォルト: 0.8）
             lightness: 明度（0.0-1.0の範囲、デフォルト: 0.6）
             offset: 色相の開始オフセット（0-360度、デフォルト: 0）
+            **options: generate_colors にそのまま渡す追加の引数
+                （組み込みの色生成器では as_tuple, return_format を指定できる）
 
         Returns:
-            hex形式の色文字列のリスト
+            hex形式の色文字列のリスト（options を指定した場合は色生成器が返す形式）
 
         Raises:
             ValueError: 色の数が0以下の場合
@@ -119,7 +156,94 @@ class Color:
             >>> print(colors)
             ['#ff0000', '#00ff00', '#0000ff']
         """
-        return self._color_generator.generate_colors(n, saturation, lightness, offset)
+        return self._generate(n, saturation, lightness, offset, **options)
+
+
+def _hsl_scale(saturation, lightness):
+    """
+    彩度・明度を hsl_to_rgb の変換式で使う0-255の尺度の値に変換
+
+    Args:
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+
+    Returns:
+        (l255, a255) - 四捨五入用の0.5を加えた明度と、色相による変化の振幅
+    """
+    # 明度と係数はあらかじめ0-255の尺度に揃え、チャネルごとの乗算を省く
+    # 0.5を加えて切り捨てることで四捨五入する（Web標準のHSL→RGB変換と同じ丸め）
+    # min() の呼び出しより条件式の方がインタプリタで速い（値は min(lightness, 1 - lightness) と同じ）
+    return lightness * 255 + 0.5, saturation * (lightness if lightness < 0.5 else 1 - lightness) * 255
+
+
+def _sector_hsl_to_rgb(hue, l255, a255):
+    """
+    _hsl_scale で変換した彩度・明度を使ってHSLからRGBへ変換（色相の区間による分岐版）
+
+    l255, a255 は色相によらないため、彩度・明度が共通の複数の色を変換する場合は
+    ループの外で一度だけ計算できます。インタプリタでは _branchless_hsl_to_rgb より速く、
+    各区間の式は _branchless_hsl_to_rgb と同じ順序で計算するため、結果は常に一致します。
+
+    Args:
+        hue: 色相（度、360度以上・負の値も可）
+        l255: _hsl_scale が返す明度
+        a255: _hsl_scale が返す振幅
+
+    Returns:
+        RGB値のタプル（r, g, b）- 各値は0-255の整数
+    """
+    h = hue % 360 / 30
+    upper = l255 + a255
+    lower = l255 - a255
+
+    # 60度ごとの区間で、各チャネルは最大値・最小値・その間を変化する値のいずれかになる
+    # 区間は二分探索で選び、比較の回数を最大3回に抑える
+    if h < 6:
+        if h < 2:
+            r, g, b = upper, l255 - a255 * (9 - (8 + h)), lower
+        elif h < 4:
+            r, g, b = l255 - a255 * (h - 3), upper, lower
+        else:
+            r, g, b = lower, upper, l255 - a255 * (9 - (4 + h))
+    elif h < 8:
+        r, g, b = lower, l255 - a255 * (8 + h - 15), upper
+    elif h < 10:
+        r, g, b = l255 - a255 * (9 - h), lower, upper
+    else:
+        r, g, b = upper, lower, l255 - a255 * (4 + h - 15)
+
+    if 0.0 <= lower <= upper < 256.0:
+        return (int(r), int(g), int(b))
+    # 範囲外の彩度・明度が与えられた場合も各値を0-255に収める
+    return (min(max(int(r), 0), 255), min(max(int(g), 0), 255), min(max(int(b), 0), 255))
+
+
+def _branchless_hsl_to_rgb(hue, l255, a255):
+    """
+    _hsl_scale で変換した彩度・明度を使ってHSLからRGBへ変換（分岐を使わない閉形式）
+
+    numbaでコンパイルする場合に使用します。結果は _sector_hsl_to_rgb と一致します。
+
+    Args:
+        hue: 色相（度、360度以上・負の値も可）
+        l255: _hsl_scale が返す明度
+        a255: _hsl_scale が返す振幅
+
+    Returns:
+        RGB値のタプル（r, g, b）- 各値は0-255の整数
+    """
+    # 各チャネルは n = 0（R）, 8（G）, 4（B）だけ色相をずらした同一の式で求まる
+    # 固定小数点の整数演算に置き換えると境界での丸め結果が変わるため、浮動小数点のまま計算する
+    h = hue % 360 / 30
+    k = h % 12
+    r = int(l255 - a255 * max(-1.0, min(k - 3, 9 - k, 1.0)))
+    k = (8 + h) % 12
+    g = int(l255 - a255 * max(-1.0, min(k - 3, 9 - k, 1.0)))
+    k = (4 + h) % 12
+    b = int(l255 - a255 * max(-1.0, min(k - 3, 9 - k, 1.0)))
+
+    # 範囲外の彩度・明度が与えられた場合も各値を0-255に収める
+    return (min(max(r, 0), 255), min(max(g, 0), 255), min(max(b, 0), 255))
 
 
 def hsl_to_rgb(hue: float, saturation: float, lightness: float) -> Tuple[int, int, int]:
@@ -128,6 +252,8 @@ def hsl_to_rgb(hue: float, saturation: float, lightness: float) -> Tuple[int, in
 
     HSL（Hue, Saturation, Lightness）色空間の値をRGB色空間の値に変換します。
     この関数は、色生成アルゴリズムで使用される内部的な変換関数です。
+    numbaがインストールされている場合、色生成器が最初にnumbaを読み込んだ後は
+    コンパイル済みの関数で変換します（結果は同じです）。
 
     Args:
         hue: 色相（0-360度、0度=赤、120度=緑、240度=青）
@@ -142,35 +268,29 @@ def hsl_to_rgb(hue: float, saturation: float, lightness: float) -> Tuple[int, in
         >>> print(f"RGB: ({r}, {g}, {b})")
         RGB: (255, 0, 0)
     """
-    hue = hue % 360
-
-    # HSLからRGBへの変換
-    c = (1 - abs(2 * lightness - 1)) * saturation
-    x = c * (1 - abs((hue / 60) % 2 - 1))
-    m = lightness - c / 2
-
-    if hue < 60:
-        r, g, b = c, x, 0
-    elif hue < 120:
-        r, g, b = x, c, 0
-    elif hue < 180:
-        r, g, b = 0, c, x
-    elif hue < 240:
-        r, g, b = 0, x, c
-    elif hue < 300:
-        r, g, b = x, 0, c
-    else:
-        r, g, b = c, 0, x
+    # numbaを読み込み済みの場合はコンパイル済みの関数で変換する
+    # 1色の変換のためにnumbaを読み込むと時間がかかるため、ここでは読み込みを行わない
+    if _compiled_hsl_to_rgb is not None:
+        return _compiled_hsl_to_rgb(hue, saturation, lightness)
+
+    # 関数呼び出しを1回減らすため、_hsl_scale と同じ式をここで計算する
+    l255 = lightness * 255 + 0.5
+    a255 = saturation * (lightness if lightness < 0.5 else 1 - lightness) * 255
+    return _sector_hsl_to_rgb(hue, l255, a255)
 
-    return (round((r + m) * 255), round((g + m) * 255), round((b + m) * 255))
 
+# 0-255の各値に対応する2桁のhex文字列
+_HEX = tuple(f"{i:02x}" for i in range(256))
 
+
+@functools.lru_cache(maxsize=4096)
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """
     RGB値をhex形式の文字列に変換
 
     RGB色空間の値を、Web標準のhex形式（#RRGGBB）の文字列に変換します。
     この関数は、色生成アルゴリズムの最終出力形式として使用されます。
+    各成分は事前に作成した2桁のhex文字列表から引き、結果はキャッシュされます。
 
     Args:
         r: 赤成分（0-255の整数）
@@ -180,12 +300,749 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     Returns:
         hex形式の色文字列（#RRGGBB形式）
 
+    Raises:
+        ValueError: 0-255の範囲外の値が含まれる場合
+
     Example:
         >>> hex_color = rgb_to_hex(255, 0, 0)
         >>> print(hex_color)
         #ff0000
     """
-    return f"#{r:02x}{g:02x}{b:02x}"
+    # 負の値で表の末尾から引かれないよう、範囲を確認してから参照する
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+        raise ValueError("RGB値は0-255の範囲である必要があります")
+    return "".join(("#", _HEX[r], _HEX[g], _HEX[b]))
+
+
+# この色数以上ではスレッド並列版のカーネルを使用する
+# 逐次版のカーネルは1色あたり約50ナノ秒で、この色数では約0.2ミリ秒かかるため、
+# スレッドの起動にかかる数十マイクロ秒を十分に上回る
+_PARALLEL_THRESHOLD = 4096
+
+# カーネルの並列ループ。numbaを読み込んだ時点で numba.prange に置き換える
+prange = range
+
+# hsl_to_rgb が使用する、_scalar_hsl_to_rgb_kernel をコンパイルした関数
+# numbaを読み込んだ時点で設定し、それまでは hsl_to_rgb がインタプリタで変換する
+_compiled_hsl_to_rgb: Optional[Callable[[float, float, float], Tuple[int, int, int]]] = None
+
+
+def _scalar_hsl_to_rgb_kernel(hue, saturation, lightness):
+    """
+    1色分のHSL値をRGB値に変換するカーネル
+
+    hsl_to_rgb と同じ結果を返します。numbaを読み込んだ後は、hsl_to_rgb が
+    これをコンパイルした関数を呼び出します（_compiled_kernels を参照）。
+
+    Args:
+        hue: 色相（度、360度以上・負の値も可）
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+
+    Returns:
+        RGB値のタプル（r, g, b）- 各値は0-255の整数
+    """
+    l255, a255 = _hsl_scale(saturation, lightness)
+    return _branchless_hsl_to_rgb(hue, l255, a255)
+
+
+def _hsl_to_rgb_kernel(hues, saturations, lightnesses, out):
+    """
+    複数のHSL値をRGB値に変換してバッファに書き込むカーネル
+
+    i 番目の色相・彩度・明度を変換し、RGB値を out[3 * i], out[3 * i + 1],
+    out[3 * i + 2] に格納します。カーネルは numba でコンパイルして使用します
+    （_compiled_kernels を参照）。
+
+    Args:
+        hues: 色相の配列（array("d")）
+        saturations: 彩度の配列（array("d")、hues と同じ長さ）
+        lightnesses: 明度の配列（array("d")、hues と同じ長さ）
+        out: 書き込み先のバッファ（長さ 3 * len(hues) の bytearray）
+    """
+    for i in range(len(hues)):
+        l255, a255 = _hsl_scale(saturations[i], lightnesses[i])
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        out[3 * i] = r
+        out[3 * i + 1] = g
+        out[3 * i + 2] = b
+
+
+def _hsl_to_rgb_parallel_kernel(hues, saturations, lightnesses, out):
+    """_hsl_to_rgb_kernel のスレッド並列版。各色の変換は互いに独立しているため prange で分割する"""
+    for i in prange(len(hues)):
+        l255, a255 = _hsl_scale(saturations[i], lightnesses[i])
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        out[3 * i] = r
+        out[3 * i + 1] = g
+        out[3 * i + 2] = b
+
+
+def _hex_digit(value):
+    """0-15の値を16進数の1文字（ASCIIコード）に変換"""
+    return value + 48 + 39 * (value > 9)
+
+
+def _write_hex(out, j, r, g, b):
+    """RGB値を "#RRGGBB" のASCII文字として out[j : j + 7] に書き込む"""
+    out[j] = 35  # "#"
+    out[j + 1] = _hex_digit(r >> 4)
+    out[j + 2] = _hex_digit(r & 15)
+    out[j + 3] = _hex_digit(g >> 4)
+    out[j + 4] = _hex_digit(g & 15)
+    out[j + 5] = _hex_digit(b >> 4)
+    out[j + 6] = _hex_digit(b & 15)
+
+
+def _hsl_to_hex_kernel(hues, saturations, lightnesses, out):
+    """
+    複数のHSL値をhex形式の色文字列に変換してバッファに書き込むカーネル
+
+    i 番目の色相・彩度・明度を変換し、"#RRGGBB" のASCII文字を
+    out[7 * i : 7 * i + 7] に格納します。RGB値のバッファを経由せずに
+    1回のループで変換から整形までを行います。
+
+    Args:
+        hues: 色相の配列（array("d")）
+        saturations: 彩度の配列（array("d")、hues と同じ長さ）
+        lightnesses: 明度の配列（array("d")、hues と同じ長さ）
+        out: 書き込み先のバッファ（長さ 7 * len(hues) の bytearray）
+    """
+    for i in range(len(hues)):
+        l255, a255 = _hsl_scale(saturations[i], lightnesses[i])
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        _write_hex(out, 7 * i, r, g, b)
+
+
+def _hsl_to_hex_parallel_kernel(hues, saturations, lightnesses, out):
+    """_hsl_to_hex_kernel のスレッド並列版。各色の変換は互いに独立しているため prange で分割する"""
+    for i in prange(len(hues)):
+        l255, a255 = _hsl_scale(saturations[i], lightnesses[i])
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        _write_hex(out, 7 * i, r, g, b)
+
+
+def _hues_to_rgb_kernel(hues, saturation, lightness, out):
+    """
+    彩度・明度が共通の複数の色相をRGB値に変換してバッファに書き込むカーネル
+
+    _hsl_to_rgb_kernel と同じ結果を書き込みますが、彩度・明度に依存する値を
+    ループの外で一度だけ計算します。
+
+    Args:
+        hues: 色相の配列（array("d")）
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+        out: 書き込み先のバッファ（長さ 3 * len(hues) の bytearray）
+    """
+    l255, a255 = _hsl_scale(saturation, lightness)
+    for i in range(len(hues)):
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        out[3 * i] = r
+        out[3 * i + 1] = g
+        out[3 * i + 2] = b
+
+
+def _hues_to_rgb_parallel_kernel(hues, saturation, lightness, out):
+    """_hues_to_rgb_kernel のスレッド並列版。各色の変換は互いに独立しているため prange で分割する"""
+    l255, a255 = _hsl_scale(saturation, lightness)
+    for i in prange(len(hues)):
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        out[3 * i] = r
+        out[3 * i + 1] = g
+        out[3 * i + 2] = b
+
+
+def _hues_to_hex_kernel(hues, saturation, lightness, out):
+    """
+    彩度・明度が共通の複数の色相をhex形式の色文字列に変換してバッファに書き込むカーネル
+
+    _hsl_to_hex_kernel と同じ結果を書き込みますが、彩度・明度に依存する値を
+    ループの外で一度だけ計算します。
+
+    Args:
+        hues: 色相の配列（array("d")）
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+        out: 書き込み先のバッファ（長さ 7 * len(hues) の bytearray）
+    """
+    l255, a255 = _hsl_scale(saturation, lightness)
+    for i in range(len(hues)):
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        _write_hex(out, 7 * i, r, g, b)
+
+
+def _hues_to_hex_parallel_kernel(hues, saturation, lightness, out):
+    """_hues_to_hex_kernel のスレッド並列版。各色の変換は互いに独立しているため prange で分割する"""
+    l255, a255 = _hsl_scale(saturation, lightness)
+    for i in prange(len(hues)):
+        r, g, b = _branchless_hsl_to_rgb(hues[i], l255, a255)
+        _write_hex(out, 7 * i, r, g, b)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_kernels() -> Optional[Dict[Callable, Callable]]:
+    """
+    numbaを読み込み、各カーネルをコンパイルした関数を作成
+
+    numbaのインポートには時間がかかるため、モジュールの読み込み時ではなく
+    最初にカーネルが必要になった時点で一度だけ実行します。
+    カーネルから呼び出す関数は register_jitable で登録し、インタプリタからは
+    これまでどおり通常の関数として呼び出せるようにします。
+
+    Returns:
+        カーネルをキー、コンパイル済みの関数を値とする辞書（numbaを使用できない場合はNone）
+    """
+    global prange, _compiled_hsl_to_rgb
+
+    if not _HAS_NUMBA:
+        return None
+    try:
+        import numba
+        from numba.extending import register_jitable
+    except ImportError:
+        return None
+
+    for func in (_hsl_scale, _branchless_hsl_to_rgb, _hex_digit, _write_hex):
+        register_jitable(func)
+    prange = numba.prange
+
+    # 並列版は逐次版と別の関数として定義しているため、キャッシュファイルが衝突しない
+    kernels = {
+        kernel: numba.njit(cache=True)(kernel)
+        for kernel in (_hsl_to_rgb_kernel, _hsl_to_hex_kernel, _hues_to_rgb_kernel, _hues_to_hex_kernel)
+    }
+    for kernel in (
+        _hsl_to_rgb_parallel_kernel,
+        _hsl_to_hex_parallel_kernel,
+        _hues_to_rgb_parallel_kernel,
+        _hues_to_hex_parallel_kernel,
+    ):
+        kernels[kernel] = numba.njit(cache=True, parallel=True)(kernel)
+
+    # 型を指定してコンパイルし、整数などの引数でも再コンパイルせずにfloat64に変換して呼び出す
+    # 数値以外の引数はインタプリタでの変換と同じくTypeErrorになる
+    kernels[_scalar_hsl_to_rgb_kernel] = numba.njit("UniTuple(int64, 3)(float64, float64, float64)", cache=True)(
+        _scalar_hsl_to_rgb_kernel
+    )
+    _compiled_hsl_to_rgb = kernels[_scalar_hsl_to_rgb_kernel]
+    return kernels
+
+
+def _run_hsl_kernel(
+    kernel,
+    parallel_kernel,
+    hues: array,
+    saturations: Union[array, float],
+    lightnesses: Union[array, float],
+    out: bytearray,
+) -> None:
+    """
+    色数に応じてコンパイル済みの逐次版・並列版のカーネルを選んで実行
+
+    Args:
+        kernel: 逐次版のカーネル（_compiled_kernels のキー）
+        parallel_kernel: スレッド並列版のカーネル（色数が多い場合に使用）
+        hues: 色相の配列（array("d")）
+        saturations: 彩度の配列（array("d")、hues と同じ長さ）、または共通の彩度
+        lightnesses: 明度の配列（array("d")、hues と同じ長さ）、または共通の明度
+        out: 書き込み先のバッファ
+    """
+    kernels = _compiled_kernels()
+    if len(hues) >= _PARALLEL_THRESHOLD:
+        import numpy as np  # numbaの読み込み時にインポート済み
+
+        # 並列化はNumPy配列のみに対応するため、配列とバッファはコピーせずにNumPy配列として渡す
+        args = [np.frombuffer(arg) if isinstance(arg, array) else arg for arg in (hues, saturations, lightnesses)]
+        kernels[parallel_kernel](*args, np.frombuffer(out, dtype=np.uint8))
+    else:
+        kernels[kernel](hues, saturations, lightnesses, out)
+
+
+@functools.lru_cache(maxsize=64)
+def _hue_table(saturation: float, lightness: float) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    整数の色相（0-359度）に対するRGB値の変換表を作成
+
+    彩度と明度の組ごとにキャッシュされ、同じ組での2回目以降の呼び出しでは
+    計算を行いません。
+
+    Args:
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+
+    Returns:
+        色相 h のRGB値を table[h] に格納したタプル（360要素）
+    """
+    l255, a255 = _hsl_scale(saturation, lightness)
+    return tuple(_sector_hsl_to_rgb(hue, l255, a255) for hue in range(360))
+
+
+def _rgb_to_hex_list(rgb: Union[bytes, bytearray], as_tuple: bool = False) -> Union[List[str], Tuple[str, ...]]:
+    """
+    RGB値を並べたバッファをhex形式の色文字列のリストに変換
+
+    バッファ全体を一度にhex文字列へ変換し、6文字ずつ切り出します。
+
+    Args:
+        rgb: r, g, b の順に各色の値を並べたバッファ
+        as_tuple: Trueの場合はリストの代わりにタプルで返す
+
+    Returns:
+        hex形式の色文字列のリスト（as_tuple=Trueの場合はタプル）
+    """
+    hex_str = rgb.hex()
+    colors = ["#" + hex_str[i : i + 6] for i in range(0, len(hex_str), 6)]
+    return tuple(colors) if as_tuple else colors
+
+
+def _ascii_to_hex_list(text: bytearray, as_tuple: bool = False) -> Union[List[str], Tuple[str, ...]]:
+    """
+    hexカーネルが書き込んだ "#RRGGBB" のASCII文字の並びを色文字列のリストに変換
+
+    Args:
+        text: 1色あたり7バイトのASCII文字を並べたバッファ
+        as_tuple: Trueの場合はリストの代わりにタプルで返す
+
+    Returns:
+        hex形式の色文字列のリスト（as_tuple=Trueの場合はタプル）
+    """
+    text = text.decode("ascii")
+    colors = [text[i : i + 7] for i in range(0, len(text), 7)]
+    return tuple(colors) if as_tuple else colors
+
+
+def _check_return_format(return_format: str) -> None:
+    """
+    return_format が対応している形式か確認
+
+    Args:
+        return_format: 確認する形式
+
+    Raises:
+        ValueError: return_format が "hex"、"rgb"、"rgba" のいずれでもない場合
+    """
+    if return_format not in _RETURN_FORMATS:
+        raise ValueError("return_formatは'hex'、'rgb'、'rgba'のいずれかである必要があります")
+
+
+def _format_rgb(rgb: Union[bytes, bytearray], return_format: str = "hex", as_tuple: bool = False) -> _Palette:
+    """
+    RGB値を並べたバッファを指定された形式の色のシーケンスに変換
+
+    Args:
+        rgb: r, g, b の順に各色の値を並べたバッファ
+        return_format: "hex"（#RRGGBB形式の文字列）、"rgb"（(r, g, b) のタプル）、
+            "rgba"（不透明度255を加えた (r, g, b, a) のタプル）のいずれか
+        as_tuple: Trueの場合はリストの代わりにタプルで返す
+
+    Returns:
+        色のリスト（as_tuple=Trueの場合はタプル）
+
+    Raises:
+        ValueError: return_format が不正な場合
+    """
+    _check_return_format(return_format)
+    if return_format == "hex":
+        return _rgb_to_hex_list(rgb, as_tuple)
+
+    channels = iter(rgb)
+    if return_format == "rgb":
+        colors = zip(channels, channels, channels)
+    else:
+        colors = zip(channels, channels, channels, itertools.repeat(255))
+    return tuple(colors) if as_tuple else list(colors)
+
+
+def _format_rgb_tuples(rgb: List[Tuple[int, int, int]], return_format: str = "hex", as_tuple: bool = False) -> _Palette:
+    """
+    RGB値のタプルのリストを指定された形式の色のシーケンスに変換
+
+    numbaを使用しない場合の _format_rgb です。インタプリタでは色ごとに変換した
+    タプルをバッファに詰め直すより、そのまま整形する方が速くなります。
+
+    Args:
+        rgb: RGB値のタプル（r, g, b）のリスト
+        return_format: "hex"、"rgb"、"rgba" のいずれか（_format_rgb を参照）
+        as_tuple: Trueの場合はリストの代わりにタプルで返す
+
+    Returns:
+        色のリスト（as_tuple=Trueの場合はタプル）
+
+    Raises:
+        ValueError: return_format が不正な場合
+    """
+    _check_return_format(return_format)
+    if return_format == "hex":
+        colors = ["#" + _HEX[r] + _HEX[g] + _HEX[b] for r, g, b in rgb]
+    elif return_format == "rgb":
+        colors = rgb
+    else:
+        colors = [color + (255,) for color in rgb]
+    return tuple(colors) if as_tuple else colors
+
+
+def _hsl_to_rgb_buffer(hues: array, saturations: Iterable[float], lightnesses: Iterable[float]) -> bytearray:
+    """
+    色ごとのHSL値をコンパイル済みのカーネルでまとめてRGB値に変換
+
+    _hsl_to_rgb_kernel で一括してRGB値に変換します。色数が多い場合は
+    スレッド並列版のカーネルを使用します。範囲外の彩度・明度が
+    与えられた場合も、各チャネルは0-255に収められます。
+
+    Args:
+        hues: 色相の配列（array("d")、360度以上・負の値も可）
+        saturations: 彩度のシーケンス（hues と同じ長さ）
+        lightnesses: 明度のシーケンス（hues と同じ長さ）
+
+    Returns:
+        r, g, b の順に各色の値を並べたバッファ
+    """
+    rgb = bytearray(3 * len(hues))
+    _run_hsl_kernel(
+        _hsl_to_rgb_kernel, _hsl_to_rgb_parallel_kernel, hues, array("d", saturations), array("d", lightnesses), rgb
+    )
+    return rgb
+
+
+def _hues_to_rgb_tuples(
+    hues: array, saturation: float, lightness: float, whole_degrees: bool
+) -> List[Tuple[int, int, int]]:
+    """
+    彩度・明度が共通の複数の色相をインタプリタでRGB値のタプルに変換
+
+    すべての色相が整数（度単位）の場合はキャッシュされた変換表を参照し、
+    計算を省略します。
+
+    Args:
+        hues: 色相の配列（array("d")、360度以上・負の値も可）
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+        whole_degrees: すべての色相が整数かどうか（呼び出し側で一度だけ判定した結果）
+
+    Returns:
+        RGB値のタプル（r, g, b）のリスト
+    """
+    if whole_degrees:
+        table = _hue_table(saturation, lightness)
+        return [table[int(hue) % 360] for hue in hues]
+
+    l255, a255 = _hsl_scale(saturation, lightness)
+    return [_sector_hsl_to_rgb(hue, l255, a255) for hue in hues]
+
+
+def hsl_to_rgb_vec(hues: Iterable[float], saturation: float, lightness: float) -> List[Tuple[int, int, int]]:
+    """
+    複数の色相をまとめてHSL色空間からRGB色空間へ変換
+
+    hsl_to_rgb を色ごとに呼び出す代わりに、すべての色相を一度に変換します。
+    各色の結果は hsl_to_rgb と一致します。
+
+    Args:
+        hues: 色相のシーケンス（0-360度、360度以上・負の値も可）
+        saturation: 彩度（0.0-1.0、0.0=グレー、1.0=純色）
+        lightness: 明度（0.0-1.0、0.0=黒、0.5=通常、1.0=白）
+
+    Returns:
+        RGB値のタプル（r, g, b）のリスト - 各値は0-255の整数
+
+    Example:
+        >>> hsl_to_rgb_vec([0, 120, 240], 1.0, 0.5)
+        [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    """
+    return _hues_to_colors(hues, saturation, lightness, return_format="rgb")
+
+
+def rgb_to_hex_batch(rgb: Iterable[Tuple[int, int, int]]) -> List[str]:
+    """
+    複数のRGB値をまとめてhex形式の文字列に変換
+
+    rgb_to_hex を色ごとに呼び出す代わりに、すべての値を1つのバイト列に詰めて
+    一度にhex文字列へ変換します。各色の結果は rgb_to_hex と一致します。
+
+    Args:
+        rgb: RGB値のタプル（r, g, b）のシーケンス - 各値は0-255の整数
+
+    Returns:
+        hex形式の色文字列（#RRGGBB形式）のリスト
+
+    Raises:
+        ValueError: 0-255の範囲外の値が含まれる場合
+
+    Example:
+        >>> rgb_to_hex_batch([(255, 0, 0), (0, 255, 0)])
+        ['#ff0000', '#00ff00']
+    """
+    return _rgb_to_hex_list(bytes(itertools.chain.from_iterable(rgb)))
+
+
+def _hsl_to_colors(
+    hues: Iterable[float],
+    saturations: Iterable[float],
+    lightnesses: Iterable[float],
+    as_tuple: bool = False,
+    return_format: str = "hex",
+) -> _Palette:
+    """
+    色ごとのHSL値をまとめて指定された形式の色に変換
+
+    すべての色生成アルゴリズムが共有する変換処理です。numbaが利用可能な場合は
+    コンパイル済みのカーネルで一括して変換し、hex形式の場合は _hsl_to_hex_kernel で
+    変換から整形までをまとめて行います。numbaを使用できない場合は、色ごとに
+    hsl_to_rgb で変換します。
+
+    Args:
+        hues: 色相のシーケンス（360度以上・負の値も可）
+        saturations: 彩度のシーケンス（hues と同じ長さ）
+        lightnesses: 明度のシーケンス（hues と同じ長さ）
+        as_tuple: Trueの場合はリストの代わりにタプルで返す
+        return_format: "hex"、"rgb"、"rgba" のいずれか（_format_rgb を参照）
+
+    Returns:
+        色のリスト（as_tuple=Trueの場合はタプル）
+
+    Raises:
+        ValueError: return_format が不正な場合
+    """
+    if _compiled_kernels() is None:
+        return _format_rgb_tuples(list(map(hsl_to_rgb, hues, saturations, lightnesses)), return_format, as_tuple)
+
+    hues = array("d", hues)
+    if return_format == "hex":
+        out = bytearray(7 * len(hues))
+        _run_hsl_kernel(
+            _hsl_to_hex_kernel, _hsl_to_hex_parallel_kernel, hues, array("d", saturations), array("d", lightnesses), out
+        )
+        return _ascii_to_hex_list(out, as_tuple)
+
+    return _format_rgb(_hsl_to_rgb_buffer(hues, saturations, lightnesses), return_format, as_tuple)
+
+
+@functools.lru_cache(maxsize=64)
+def _hue_hex_table(saturation: float, lightness: float) -> Tuple[str, ...]:
+    """
+    整数の色相（0-359度）に対するhex形式の色文字列の変換表を作成
+
+    _hue_table のRGB値をhex形式の文字列に変換したもので、彩度と明度の組ごとに
+    キャッシュされます。
+
+    Args:
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+
+    Returns:
+        色相 h の色文字列を table[h] に格納したタプル（360要素）
+    """
+    return _format_rgb_tuples(_hue_table(saturation, lightness), as_tuple=True)
+
+
+def _hues_to_colors(
+    hues: Iterable[float], saturation: float, lightness: float, as_tuple: bool = False, return_format: str = "hex"
+) -> _Palette:
+    """
+    彩度・明度が共通の複数の色相をまとめて指定された形式の色に変換
+
+    hex形式ですべての色相が整数（度単位）の場合は、キャッシュされた色文字列の
+    変換表を参照するだけで変換します。それ以外の場合、numbaが利用可能であれば
+    コンパイル済みのカーネルで一括して変換し、hex形式の場合は _hues_to_hex_kernel で
+    変換から整形までをまとめて行います。numbaを使用できない場合は
+    _hues_to_rgb_tuples で変換します。
+
+    Args:
+        hues: 色相のシーケンス（360度以上・負の値も可）
+        saturation: 彩度（0.0-1.0）
+        lightness: 明度（0.0-1.0）
+        as_tuple: Trueの場合はリストの代わりにタプルで返す
+        return_format: "hex"、"rgb"、"rgba" のいずれか（_format_rgb を参照）
+
+    Returns:
+        色のリスト（as_tuple=Trueの場合はタプル）
+
+    Raises:
+        ValueError: return_format が不正な場合
+
+    Example:
+        >>> _hues_to_colors([0, 120, 240], 1.0, 0.5)
+        ['#ff0000', '#00ff00', '#0000ff']
+    """
+    hues = array("d", hues)
+    compiled = _compiled_kernels() is not None
+
+    # 整数の判定は変換表を使う場合のみ必要なため、ここで一度だけ行い下位の関数に渡す
+    whole_degrees = (return_format == "hex" or not compiled) and all(hue.is_integer() for hue in hues)
+    if return_format == "hex" and whole_degrees:
+        table = _hue_hex_table(saturation, lightness)
+        colors = [table[int(hue) % 360] for hue in hues]
+        return tuple(colors) if as_tuple else colors
+
+    if not compiled:
+        rgb_tuples = _hues_to_rgb_tuples(hues, saturation, lightness, whole_degrees)
+        return _format_rgb_tuples(rgb_tuples, return_format, as_tuple)
+
+    n = len(hues)
+    if return_format == "hex":
+        out = bytearray(7 * n)
+        _run_hsl_kernel(_hues_to_hex_kernel, _hues_to_hex_parallel_kernel, hues, saturation, lightness, out)
+        return _ascii_to_hex_list(out, as_tuple)
+
+    rgb = bytearray(3 * n)
+    _run_hsl_kernel(_hues_to_rgb_kernel, _hues_to_rgb_parallel_kernel, hues, saturation, lightness, rgb)
+    return _format_rgb(rgb, return_format, as_tuple)
+
+
+# 比率ごとに計算済みの色相の列（要求された最大の色数まで、_RATIO_HUE_MAX_LENGTH 個を上限に延長される）
+_RATIO_HUE_SEQUENCES: Dict[float, List[float]] = {}
+_RATIO_HUE_LOCK = threading.Lock()
+
+# 比率ごとに保持する色相の最大数と、列を保持する比率の最大数
+# 組み込みの色生成器の比率（_BUILTIN_HUE_RATIOS）は、比率の数が上限に達していても保持する
+_RATIO_HUE_MAX_LENGTH = 4096
+_RATIO_HUE_MAX_RATIOS = 16
+
+
+def _ratio_hues(n: int, ratio: float) -> List[float]:
+    """
+    比率 ratio ずつ回転させた n 個の色相を作成
+
+    黄金比・フィボナッチのアルゴリズムが共有する色相の列です。
+    i 番目の色相は n によらず (i, ratio) のみで決まり、n 色の列はより多い色数の列の
+    先頭部分になるため、比率ごとに1つの列を保持し、足りない分だけ延長して再利用します。
+    保持する列の長さと比率の数には上限があり、上限を超える分は保持せずにその都度計算します。
+    組み込みの色生成器の比率は、先に多数の比率が使われた場合も常に保持します。
+
+    Args:
+        n: 色相の数
+        ratio: 1色ごとに回転させる割合（0.0-1.0、1.0で360度）
+
+    Returns:
+        0-360度の色相のリスト
+    """
+    if n > _RATIO_HUE_MAX_LENGTH:
+        # 保持している先頭部分を再利用し、上限を超える分のみ計算する
+        head = _ratio_hues(_RATIO_HUE_MAX_LENGTH, ratio)
+        return head + [((i * ratio) % 1.0) * 360 for i in range(_RATIO_HUE_MAX_LENGTH, n)]
+
+    sequence = _RATIO_HUE_SEQUENCES.get(ratio)
+    if sequence is None or len(sequence) < n:
+        # 生成結果のキャッシュと同じく、更新はロックを取って行う
+        # 列は延長されるだけで既存の値は変わらないため、読み出し側はロックを取らない
+        with _RATIO_HUE_LOCK:
+            sequence = _RATIO_HUE_SEQUENCES.get(ratio)
+            if sequence is None:
+                if len(_RATIO_HUE_SEQUENCES) >= _RATIO_HUE_MAX_RATIOS and ratio not in _BUILTIN_HUE_RATIOS:
+                    # 比率を変えた色生成器が多数ある場合は、新しい比率の列を保持しない
+                    return [((i * ratio) % 1.0) * 360 for i in range(n)]
+                sequence = _RATIO_HUE_SEQUENCES[ratio] = []
+            start = len(sequence)
+            sequence.extend(((i * ratio) % 1.0) * 360 for i in range(start, n))
+    return sequence[:n]
+
+
+# 色生成アルゴリズムごとにキャッシュへ保持する色の総数の上限（生成結果の個数ではなく色数で数える）
+_PALETTE_CACHE_COLORS = 65536
+
+# UIなどでよく使われる色数。既定のパラメータでの生成結果は上限によって破棄しない
+_COMMON_PALETTE_SIZES = frozenset((3, 4, 5, 6, 8, 10, 12, 16))
+
+
+def _memoize_palette(*attributes: str):
+    """
+    generate_colors の生成結果をキャッシュするデコレータ
+
+    生成結果は (クラス, n, saturation, lightness, offset, return_format) と、
+    attributes で指定した色生成器の属性の値のみで決まるため、同じ引数・同じ属性値での
+    2回目以降の呼び出しではキャッシュから結果を返します。
+    キャッシュはインスタンスではなくクラスと属性値をキーとするため、同じクラスで
+    同じ属性値のインスタンス間で共有されます。インスタンスやサブクラスで属性を
+    変更した場合や、クラス属性を変更した場合は別の結果として扱います。
+    保持する色の総数が上限を超える場合は最も長く使われていない結果から破棄し、
+    1つで上限を超える生成結果はキャッシュしません。
+    キャッシュの参照・追加・破棄はすべてロックを取って行うため、複数のスレッドから呼び出せます。
+    キャッシュにはタプルで保持し、呼び出し側には毎回新しいリストを返すため、
+    戻り値を変更してもキャッシュには影響しません。as_tuple=Trueの場合は
+    キャッシュしたタプルをコピーせずに返します。
+    既定の彩度・明度・オフセット・属性値でよく使われる色数の結果は、
+    キャッシュの上限とは別に保持し続けます。
+
+    Args:
+        *attributes: 生成結果に影響する色生成器の属性名（例: "golden_ratio"）
+
+    Returns:
+        generate_colors メソッドをキャッシュ付きのメソッドに置き換えるデコレータ。
+        置き換えたメソッドの cache_clear() でキャッシュを空にできます
+    """
+    # 属性がない場合も同じ形のキーになるよう、属性値の代わりにNoneを使う
+    get_state = operator.attrgetter(*attributes) if attributes else (lambda generator: None)
+
+    def decorator(generate_colors):
+        cache = {}
+        common_palettes = {}
+        lock = threading.Lock()
+        # cache に保持している色の総数
+        cached_colors = 0
+
+        @functools.wraps(generate_colors)
+        def wrapper(
+            self,
+            n: int,
+            saturation: float = 0.8,
+            lightness: float = 0.6,
+            offset: float = 0,
+            as_tuple: bool = False,
+            return_format: str = "hex",
+        ) -> _Palette:
+            # 不正な形式は色を計算する前に検出する
+            _check_return_format(return_format)
+            state = get_state(self)
+            key = (type(self), n, saturation, lightness, offset, return_format, state)
+            is_common = (
+                saturation == 0.8
+                and lightness == 0.6
+                and offset == 0
+                and return_format == "hex"
+                and n in _COMMON_PALETTE_SIZES
+                and state == get_state(type(self))
+            )
+
+            nonlocal cached_colors
+            palettes = common_palettes if is_common else cache
+            try:
+                with lock:
+                    # 取り出して末尾に入れ直すことで、最近使われた結果として扱う
+                    colors = palettes.pop(key, None)
+                    if colors is not None:
+                        palettes[key] = colors
+            except TypeError:
+                # 属性にリストなどハッシュ化できない値が設定されている場合はキャッシュしない
+                return generate_colors(self, n, saturation, lightness, offset, as_tuple, return_format)
+
+            if colors is None:
+                # 色の計算はロックの外で行い、他のスレッドのキャッシュ参照を待たせない
+                colors = generate_colors(self, n, saturation, lightness, offset, True, return_format)
+                with lock:
+                    if is_common:
+                        palettes[key] = colors
+                    elif len(colors) <= _PALETTE_CACHE_COLORS and key not in cache:
+                        # 色の総数が上限に収まるまで、最も長く使われていない結果から破棄する
+                        while cache and cached_colors + len(colors) > _PALETTE_CACHE_COLORS:
+                            cached_colors -= len(cache.pop(next(iter(cache))))
+                        cache[key] = colors
+                        cached_colors += len(colors)
+
+            # タプルは変更できないため、キャッシュをそのまま共有できる
+            return colors if as_tuple else list(colors)
+
+        def cache_clear() -> None:
+            nonlocal cached_colors
+            with lock:
+                cache.clear()
+                common_palettes.clear()
+                cached_colors = 0
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
 
 
 class GoldenRatioColorGenerator(ColorGenerator):
@@ -210,11 +1067,18 @@ class GoldenRatioColorGenerator(ColorGenerator):
         ['#ff0000', '#00ff00', '#0000ff', '#ffff00', '#ff00ff']
     """
 
-    def __init__(self):
-        """黄金比の値を初期化"""
-        self.golden_ratio = 0.618033988749895
-
-    def generate_colors(self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0) -> List[str]:
+    golden_ratio = 0.618033988749895
+
+    @_memoize_palette("golden_ratio")
+    def generate_colors(
+        self,
+        n: int,
+        saturation: float = 0.8,
+        lightness: float = 0.6,
+        offset: float = 0,
+        as_tuple: bool = False,
+        return_format: str = "hex",
+    ) -> _Palette:
         """
         黄金比を使用して色相を決定するアルゴリズム
 
@@ -227,12 +1091,15 @@ class GoldenRatioColorGenerator(ColorGenerator):
             saturation: 彩度（0.0-1.0の範囲、デフォルト: 0.8）
             lightness: 明度（0.0-1.0の範囲、デフォルト: 0.6）
             offset: 色相の開始オフセット（0-360度、デフォルト: 0）
+            as_tuple: Trueの場合はリストの代わりにタプルで返す（デフォルト: False）
+            return_format: 色の形式。"hex"（#RRGGBB形式の文字列）、"rgb"（(r, g, b) のタプル）、
+                "rgba"（不透明度255を加えた (r, g, b, a) のタプル）のいずれか（デフォルト: "hex"）
 
         Returns:
-            hex形式の色文字列のリスト
+            return_format で指定した形式の色のリスト（as_tuple=Trueの場合はタプル）
 
         Raises:
-            ValueError: 色の数が0以下の場合
+            ValueError: 色の数が0以下の場合、または return_format が不正な場合
 
         Example:
             >>> generator = GoldenRatioColorGenerator()
@@ -243,16 +1110,10 @@ class GoldenRatioColorGenerator(ColorGenerator):
         if n <= 0:
             raise ValueError("色の数は1以上である必要があります")
 
-        colors = []
-
-        for i in range(n):
-            hue = ((i * self.golden_ratio) % 1.0) * 360 + offset
-            hue = hue % 360
-
-            r, g, b = hsl_to_rgb(hue, saturation, lightness)
-            colors.append(rgb_to_hex(r, g, b))
-
-        return colors
+        # 色相は[offset, offset + 360)に収まり、360度の折り返しは変換時に行われる
+        offset = offset % 360
+        hues = [hue + offset for hue in _ratio_hues(n, self.golden_ratio)]
+        return _hues_to_colors(hues, saturation, lightness, as_tuple, return_format)
 
 
 class EquidistantColorGenerator(ColorGenerator):
@@ -279,7 +1140,16 @@ class EquidistantColorGenerator(ColorGenerator):
         ['#ff0000', '#ffff00', '#00ff00', '#00ffff', '#0000ff', '#ff00ff']
     """
 
-    def generate_colors(self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0) -> List[str]:
+    @_memoize_palette()
+    def generate_colors(
+        self,
+        n: int,
+        saturation: float = 0.8,
+        lightness: float = 0.6,
+        offset: float = 0,
+        as_tuple: bool = False,
+        return_format: str = "hex",
+    ) -> _Palette:
         """
         等間隔色相分割による色生成アルゴリズム
 
@@ -292,12 +1162,15 @@ class EquidistantColorGenerator(ColorGenerator):
             saturation: 彩度（0.0-1.0の範囲、デフォルト: 0.8）
             lightness: 明度（0.0-1.0の範囲、デフォルト: 0.6）
             offset: 色相の開始オフセット（0-360度、デフォルト: 0）
+            as_tuple: Trueの場合はリストの代わりにタプルで返す（デフォルト: False）
+            return_format: 色の形式。"hex"（#RRGGBB形式の文字列）、"rgb"（(r, g, b) のタプル）、
+                "rgba"（不透明度255を加えた (r, g, b, a) のタプル）のいずれか（デフォルト: "hex"）
 
         Returns:
-            hex形式の色文字列のリスト
+            return_format で指定した形式の色のリスト（as_tuple=Trueの場合はタプル）
 
         Raises:
-            ValueError: 色の数が0以下の場合
+            ValueError: 色の数が0以下の場合、または return_format が不正な場合
 
         Example:
             >>> generator = EquidistantColorGenerator()
@@ -308,16 +1181,10 @@ class EquidistantColorGenerator(ColorGenerator):
         if n <= 0:
             raise ValueError("色の数は1以上である必要があります")
 
-        colors = []
-
-        for i in range(n):
-            hue = (i / n) * 360 + offset
-            hue = hue % 360
-
-            r, g, b = hsl_to_rgb(hue, saturation, lightness)
-            colors.append(rgb_to_hex(r, g, b))
-
-        return colors
+        # 360度の折り返しは変換時に行われる
+        # i * (360 / n) とすると丸め誤差で色が変わる場合があるため、(i / n) * 360 の順で計算する
+        hues = [(i / n) * 360 + offset for i in range(n)]
+        return _hues_to_colors(hues, saturation, lightness, as_tuple, return_format)
 
 
 class FibonacciColorGenerator(ColorGenerator):
@@ -340,11 +1207,18 @@ class FibonacciColorGenerator(ColorGenerator):
         ['#ff0000', '#00ff00', '#0000ff', '#ffff00', '#ff00ff', '#00ffff', '#ff8000', '#8000ff']
     """
 
-    def __init__(self):
-        """フィボナッチ数列の逆数を初期化"""
-        self.fibonacci_ratio = 0.381966011250105  # 1 - goldenRatio
-
-    def generate_colors(self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0) -> List[str]:
+    fibonacci_ratio = 0.381966011250105  # 1 - goldenRatio
+
+    @_memoize_palette("fibonacci_ratio")
+    def generate_colors(
+        self,
+        n: int,
+        saturation: float = 0.8,
+        lightness: float = 0.6,
+        offset: float = 0,
+        as_tuple: bool = False,
+        return_format: str = "hex",
+    ) -> _Palette:
         """
         フィボナッチ数列を使用した色生成アルゴリズム
 
@@ -357,12 +1231,15 @@ class FibonacciColorGenerator(ColorGenerator):
             saturation: 彩度（0.0-1.0の範囲、デフォルト: 0.8）
             lightness: 明度（0.0-1.0の範囲、デフォルト: 0.6）
             offset: 色相の開始オフセット（0-360度、デフォルト: 0）
+            as_tuple: Trueの場合はリストの代わりにタプルで返す（デフォルト: False）
+            return_format: 色の形式。"hex"（#RRGGBB形式の文字列）、"rgb"（(r, g, b) のタプル）、
+                "rgba"（不透明度255を加えた (r, g, b, a) のタプル）のいずれか（デフォルト: "hex"）
 
         Returns:
-            hex形式の色文字列のリスト
+            return_format で指定した形式の色のリスト（as_tuple=Trueの場合はタプル）
 
         Raises:
-            ValueError: 色の数が0以下の場合
+            ValueError: 色の数が0以下の場合、または return_format が不正な場合
 
         Example:
             >>> generator = FibonacciColorGenerator()
@@ -373,16 +1250,10 @@ class FibonacciColorGenerator(ColorGenerator):
         if n <= 0:
             raise ValueError("色の数は1以上である必要があります")
 
-        colors = []
-
-        for i in range(n):
-            hue = ((i * self.fibonacci_ratio) % 1.0) * 360 + offset
-            hue = hue % 360
-
-            r, g, b = hsl_to_rgb(hue, saturation, lightness)
-            colors.append(rgb_to_hex(r, g, b))
-
-        return colors
+        # 色相は[offset, offset + 360)に収まり、360度の折り返しは変換時に行われる
+        offset = offset % 360
+        hues = [hue + offset for hue in _ratio_hues(n, self.fibonacci_ratio)]
+        return _hues_to_colors(hues, saturation, lightness, as_tuple, return_format)
 
 
 class ColorWheelColorGenerator(ColorGenerator):
@@ -393,7 +1264,7 @@ class ColorWheelColorGenerator(ColorGenerator):
     補色・三色配色など、視覚的調和を数学的に体系化した理論を実装しています。
 
     Attributes:
-        base_hues (List[float]): 基本色相のリスト（赤、黄、緑、シアン、青、マゼンタ）
+        base_hues (Tuple[int, ...]): 基本色相のタプル（赤、黄、緑、シアン、青、マゼンタ）
 
     Methods:
         generate_colors: カラーホイール理論に基づく色生成
@@ -408,12 +1279,19 @@ class ColorWheelColorGenerator(ColorGenerator):
         ['#ff0000', '#ffff00', '#00ff00', '#00ffff', '#0000ff', '#ff00ff']
     """
 
-    def __init__(self):
-        """基本色相を定義"""
-        # 基本色相を定義（赤、黄、緑、シアン、青、マゼンタ）
-        self.base_hues = [0, 60, 120, 180, 240, 300]
-
-    def generate_colors(self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0) -> List[str]:
+    # 基本色相を定義（赤、黄、緑、シアン、青、マゼンタ）
+    base_hues = (0, 60, 120, 180, 240, 300)
+
+    @_memoize_palette("base_hues")
+    def generate_colors(
+        self,
+        n: int,
+        saturation: float = 0.8,
+        lightness: float = 0.6,
+        offset: float = 0,
+        as_tuple: bool = False,
+        return_format: str = "hex",
+    ) -> _Palette:
         """
         カラーホイール理論に基づく補色・三色配色アルゴリズム
 
@@ -426,12 +1304,15 @@ class ColorWheelColorGenerator(ColorGenerator):
             saturation: 彩度（0.0-1.0の範囲、デフォルト: 0.8）
             lightness: 明度（0.0-1.0の範囲、デフォルト: 0.6）
             offset: 色相の開始オフセット（0-360度、デフォルト: 0）
+            as_tuple: Trueの場合はリストの代わりにタプルで返す（デフォルト: False）
+            return_format: 色の形式。"hex"（#RRGGBB形式の文字列）、"rgb"（(r, g, b) のタプル）、
+                "rgba"（不透明度255を加えた (r, g, b, a) のタプル）のいずれか（デフォルト: "hex"）
 
         Returns:
-            hex形式の色文字列のリスト
+            return_format で指定した形式の色のリスト（as_tuple=Trueの場合はタプル）
 
         Raises:
-            ValueError: 色の数が0以下の場合
+            ValueError: 色の数が0以下の場合、または return_format が不正な場合
 
         Example:
             >>> generator = ColorWheelColorGenerator()
@@ -442,30 +1323,25 @@ class ColorWheelColorGenerator(ColorGenerator):
         if n <= 0:
             raise ValueError("色の数は1以上である必要があります")
 
-        colors = []
-
-        for i in range(n):
-            if n <= 6:
-                # 6色以下の場合は基本色相を使用
-                hue = self.base_hues[i % 6] + offset
-            else:
-                # 6色を超える場合は補間
-                base_index = int(i / (n / 6))
-                next_index = (base_index + 1) % 6
-                ratio = (i % (n / 6)) / (n / 6)
-                hue = (
-                    self.base_hues[base_index]
-                    + (self.base_hues[next_index] - self.base_hues[base_index]) * ratio
-                    + offset
-                )
+        base_hues = self.base_hues
 
-            # 360度を超えた場合の処理
-            hue = hue % 360
+        if n <= 6:
+            # 6色以下の場合は基本色相を使用
+            return _hues_to_colors(
+                [hue + offset for hue in base_hues[:n]], saturation, lightness, as_tuple, return_format
+            )
 
-            r, g, b = hsl_to_rgb(hue, saturation, lightness)
-            colors.append(rgb_to_hex(r, g, b))
+        # 6色を超える場合は隣り合う基本色相の間を補間
+        # 360度を超えた色相の折り返しは変換時に行われる
+        segment = n / 6
+        hues = []
+        for i in range(n):
+            base_index = int(i / segment)
+            base_hue = base_hues[base_index]
+            ratio = (i % segment) / segment
+            hues.append(base_hue + (base_hues[(base_index + 1) % 6] - base_hue) * ratio + offset)
 
-        return colors
+        return _hues_to_colors(hues, saturation, lightness, as_tuple, return_format)
 
 
 class AlternatingColorGenerator(ColorGenerator):
@@ -491,13 +1367,20 @@ class AlternatingColorGenerator(ColorGenerator):
         ['#00b3b3', '#ff4d00', '#00ccb3', '#ff3300', '#00e6b3', '#ff1a00', '#00ffb3', '#ff0000', '#1affb3', '#e60000']
     """
 
-    def __init__(self):
-        """基本色相と終了色相を初期化"""
-        self.base_hue = 90  # 基本色相（寒色系の開始）
-        self.end_hue = 240  # 終了色相（寒色系の終了）
-        self.golden_ratio = 0.618033988749895  # 黄金比
-
-    def generate_colors(self, n: int, saturation: float = 0.8, lightness: float = 0.6, offset: float = 0) -> List[str]:
+    base_hue = 90  # 基本色相（寒色系の開始）
+    end_hue = 240  # 終了色相（寒色系の終了）
+    golden_ratio = 0.618033988749895  # 黄金比
+
+    @_memoize_palette("base_hue", "end_hue", "golden_ratio")
+    def generate_colors(
+        self,
+        n: int,
+        saturation: float = 0.8,
+        lightness: float = 0.6,
+        offset: float = 0,
+        as_tuple: bool = False,
+        return_format: str = "hex",
+    ) -> _Palette:
         """
         交互色生成アルゴリズム（黄金比ベース）
 
@@ -510,12 +1393,15 @@ class AlternatingColorGenerator(ColorGenerator):
             saturation: 彩度（0.0-1.0の範囲、デフォルト: 0.8）
             lightness: 明度（0.0-1.0の範囲、デフォルト: 0.6）
             offset: 色相の開始オフセット（0-360度、デフォルト: 0）
+            as_tuple: Trueの場合はリストの代わりにタプルで返す（デフォルト: False）
+            return_format: 色の形式。"hex"（#RRGGBB形式の文字列）、"rgb"（(r, g, b) のタプル）、
+                "rgba"（不透明度255を加えた (r, g, b, a) のタプル）のいずれか（デフォルト: "hex"）
 
         Returns:
-            hex形式の色文字列のリスト
+            return_format で指定した形式の色のリスト（as_tuple=Trueの場合はタプル）
 
         Raises:
-            ValueError: 色の数が0以下の場合
+            ValueError: 色の数が0以下の場合、または return_format が不正な場合
 
         Example:
             >>> generator = AlternatingColorGenerator()
@@ -526,72 +1412,32 @@ class AlternatingColorGenerator(ColorGenerator):
         if n <= 0:
             raise ValueError("色の数は1以上である必要があります")
 
-        colors = []
-        hue_range = self.end_hue - self.base_hue
+        base_hue = self.base_hue
+        hue_range = self.end_hue - base_hue
+        ratio = self.golden_ratio
 
-        for i in range(n):
-            is_even = i % 2 == 0
-
-            if is_even:
-                # 偶数番目：寒色系の範囲を黄金比で分割
-                cold_index = i // 2
-                golden_angle = (cold_index * self.golden_ratio) % 1
-                hue = self.base_hue + (golden_angle * hue_range) + offset
-            else:
-                # 奇数番目：寒色系の補色（暖色系）
-                cold_index = (i - 1) // 2
-                golden_angle = (cold_index * self.golden_ratio) % 1
-                cold_hue = self.base_hue + (golden_angle * hue_range)
-                hue = (cold_hue + 180 + offset) % 360
-
-            # 色の数が多い場合は彩度と明度を少しずつ変化させる
-            saturation_variation = min(0.1, n / 100)  # 最大0.1の変化
-            lightness_variation = min(0.1, n / 100)  # 最大0.1の変化
-
-            adjusted_saturation = max(0.3, min(1.0, saturation + (i * 0.02 - 0.01 * n) * saturation_variation))
-            adjusted_lightness = max(0.3, min(0.8, lightness + (i * 0.015 - 0.0075 * n) * lightness_variation))
-
-            r, g, b = hsl_to_rgb(hue, adjusted_saturation, adjusted_lightness)
-            colors.append(rgb_to_hex(r, g, b))
-
-        return colors
-
-
-# 使用例
-if __name__ == "__main__":
-    # シンプルな使用例
-    print("=== シンプルな使用例 ===")
-
-    # 抽象クラスを使用した柔軟な設計
-    generators = {
-        "黄金比": GoldenRatioColorGenerator(),
-        "等間隔": EquidistantColorGenerator(),
-        "フィボナッチ": FibonacciColorGenerator(),
-        "カラーホイール": ColorWheelColorGenerator(),
-        "交互色生成": AlternatingColorGenerator(),
-    }
+        # 偶数番目：寒色系の範囲を黄金比で分割
+        # 奇数番目：直前の偶数番目と同じ寒色系の補色（暖色系）
+        hues = [base_hue + (((i // 2) * ratio) % 1) * hue_range + 180 * (i % 2) + offset for i in range(n)]
+
+        # 色の数が多い場合は彩度と明度を少しずつ変化させる（最大0.1の変化）
+        # 変化量と中心を揃えるための項はnのみに依存するため、ループの外で計算する
+        variation = min(0.1, n / 100)
+        saturation_shift = 0.01 * n
+        lightness_shift = 0.0075 * n
+        saturations = [max(0.3, min(1.0, saturation + (i * 0.02 - saturation_shift) * variation)) for i in range(n)]
+        lightnesses = [max(0.3, min(0.8, lightness + (i * 0.015 - lightness_shift) * variation)) for i in range(n)]
+
+        return _hsl_to_colors(hues, saturations, lightnesses, as_tuple, return_format)
+
+
+# _ratio_hues で比率の数の上限によらず常に保持する、組み込みの色生成器の比率
+_BUILTIN_HUE_RATIOS = frozenset((GoldenRatioColorGenerator.golden_ratio, FibonacciColorGenerator.fibonacci_ratio))
 
-    for name, generator in generators.items():
-        colors = generator.generate_colors(5)
-        print(f"{name}: {colors}")
-
-    print("\n=== 依存性逆転の原則を体現した使用例 ===")
-
-    # Colorクラスを使用した依存性逆転の例
-    golden_color = Color(GoldenRatioColorGenerator())
-    equidistant_color = Color(EquidistantColorGenerator())
-    fibonacci_color = Color(FibonacciColorGenerator())
-    color_wheel_color = Color(ColorWheelColorGenerator())
-    alternating_color = Color(AlternatingColorGenerator())
-
-    # 同じインターフェースで異なるアルゴリズムを使用
-    print(f"黄金比色: {golden_color.generate(5)}")
-    print(f"等間隔色: {equidistant_color.generate(5)}")
-    print(f"フィボナッチ色: {fibonacci_color.generate(5)}")
-    print(f"カラーホイール色: {color_wheel_color.generate(5)}")
-    print(f"交互色生成: {alternating_color.generate(5)}")
-
-    # パラメータを変更して使用
-    print(f"\n高彩度黄金比色: {golden_color.generate(3, saturation=0.9, lightness=0.5)}")
-    print(f"オフセット等間隔色: {equidistant_color.generate(3, offset=90)}")
-    print(f"交互色生成（10色）: {alternating_color.generate(10)}")
+# 組み込みの色生成器は状態を持たないため、共有のインスタンスを用意する
+# 呼び出しのたびにインスタンスを作成せずに再利用できる
+GOLDEN_RATIO_GENERATOR = GoldenRatioColorGenerator()
+EQUIDISTANT_GENERATOR = EquidistantColorGenerator()
+FIBONACCI_GENERATOR = FibonacciColorGenerator()
+COLOR_WHEEL_GENERATOR = ColorWheelColorGenerator()
+ALTERNATING_GENERATOR = AlternatingColorGenerator()
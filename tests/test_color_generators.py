@@ -2,20 +2,46 @@
 色生成アルゴリズムのテストファイル - シンプルな抽象クラス設計対応版
 """
 
+import itertools
+import sys
+import threading
 import unittest
+from unittest import mock
 
 from src.color_generators import (  # 抽象クラスと実装クラス; Colorクラス; ユーティリティ関数
+    _PARALLEL_THRESHOLD,
+    _RATIO_HUE_MAX_LENGTH,
+    _RATIO_HUE_MAX_RATIOS,
+    _RATIO_HUE_SEQUENCES,
+    FIBONACCI_GENERATOR,
+    GOLDEN_RATIO_GENERATOR,
+    AlternatingColorGenerator,
     Color,
     ColorGenerator,
     ColorWheelColorGenerator,
     EquidistantColorGenerator,
     FibonacciColorGenerator,
     GoldenRatioColorGenerator,
+    _branchless_hsl_to_rgb,
+    _compiled_kernels,
+    _hsl_scale,
+    _memoize_palette,
+    _ratio_hues,
+    _sector_hsl_to_rgb,
     hsl_to_rgb,
+    hsl_to_rgb_vec,
     rgb_to_hex,
+    rgb_to_hex_batch,
 )
 
 
+def _assert_all_hex(test: unittest.TestCase, colors, n: int) -> None:
+    """n個の互いに異なるhex形式（#RRGGBB）の色文字列であることを確認"""
+    test.assertEqual(len(colors), n)
+    test.assertEqual(len(set(colors)), n)
+    test.assertTrue(all(isinstance(c, str) and len(c) == 7 and c[0] == "#" for c in colors), colors)
+
+
 class TestColorGenerators(unittest.TestCase):
 
     def test_hsl_to_rgb(self):
@@ -44,6 +70,59 @@ class TestColorGenerators(unittest.TestCase):
         self.assertEqual(g, 128)
         self.assertEqual(b, 128)
 
+    def test_hsl_to_rgb_rounds_half_up(self):
+        """端数がちょうど0.5の値は切り上げられることを確認（Web標準のHSL→RGB変換と同じ丸め）"""
+        # 各成分は 229.5, 127.5, 25.5
+        self.assertEqual(hsl_to_rgb(30, 0.8, 0.5), (230, 128, 26))
+        # 0.3 * 255 = 76.5 は、偶数に丸める round() では76になる
+        self.assertEqual(hsl_to_rgb(0, 0.0, 0.3), (77, 77, 77))
+
+        # 一括変換・色生成器も同じ規則で丸める
+        self.assertEqual(hsl_to_rgb_vec([30, 0], 0.8, 0.5), [(230, 128, 26), (230, 26, 26)])
+        self.assertEqual(EquidistantColorGenerator().generate_colors(1, 0.0, 0.3), ["#4d4d4d"])
+
+    def test_hsl_to_rgb_hue_wraps_around(self):
+        """360度以上・負の色相が、360度の範囲に折り返した色相と同じ色になることを確認"""
+        for hue in (0.5, 123.25, 354.0, 359.75):
+            expected = hsl_to_rgb(hue, 0.5, 0.5)
+            for turns in (-3, -1, 1, 9):
+                self.assertEqual(hsl_to_rgb(hue + 360 * turns, 0.5, 0.5), expected)
+
+        # 一括変換・色生成器の結果もhsl_to_rgbと一致する
+        self.assertEqual(hsl_to_rgb_vec([3594], 0.5, 0.5), [hsl_to_rgb(3594, 0.5, 0.5)])
+        colors = EquidistantColorGenerator().generate_colors(4, 0.5, 0.5, 3594)
+        self.assertEqual(colors[0], rgb_to_hex(*hsl_to_rgb(3594, 0.5, 0.5)))
+
+    def test_sector_and_branchless_conversions_match(self):
+        """分岐版と閉形式のHSL→RGB変換が同じ結果になることを確認（numbaの有無で結果が変わらない）"""
+        for saturation, lightness in [(0.8, 0.6), (0.5, 0.5), (1.0, 0.25), (0.37, 0.83), (1.5, 0.6), (0.8, -0.2)]:
+            l255, a255 = _hsl_scale(saturation, lightness)
+            for i in range(-720, 4320):
+                hue = i * 0.75
+                self.assertEqual(_sector_hsl_to_rgb(hue, l255, a255), _branchless_hsl_to_rgb(hue, l255, a255))
+
+    def test_hsl_to_rgb_after_numba_is_loaded(self):
+        """numbaを読み込んだ後もhsl_to_rgbの結果と引数の扱いが変わらないことを確認"""
+        if _compiled_kernels() is None:
+            self.skipTest("numbaがインストールされていません")
+
+        for saturation, lightness in [(0.8, 0.6), (0.5, 0.5), (1.0, 0.25), (1.5, 0.6), (0.8, -0.2)]:
+            l255, a255 = _hsl_scale(saturation, lightness)
+            for i in range(-720, 4320, 7):
+                hue = i * 0.75
+                self.assertEqual(hsl_to_rgb(hue, saturation, lightness), _sector_hsl_to_rgb(hue, l255, a255))
+        self.assertEqual(hsl_to_rgb(0, 1, 0.5), (255, 0, 0))
+        self.assertIsInstance(hsl_to_rgb(0, 1, 0.5)[0], int)
+        with self.assertRaises(TypeError):
+            hsl_to_rgb("0", 1.0, 0.5)
+
+    def test_hsl_to_rgb_vec(self):
+        """複数の色相の一括変換がhsl_to_rgbと一致することを確認"""
+        self.assertEqual(hsl_to_rgb_vec([0, 120, 240], 1.0, 0.5), [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+
+        hues = [i * 7.3 - 20 for i in range(100)]
+        self.assertEqual(hsl_to_rgb_vec(hues, 0.8, 0.6), [hsl_to_rgb(hue, 0.8, 0.6) for hue in hues])
+
     def test_rgb_to_hex(self):
         """RGBからhexへの変換テスト"""
         self.assertEqual(rgb_to_hex(255, 0, 0), "#ff0000")
@@ -53,21 +132,26 @@ class TestColorGenerators(unittest.TestCase):
         self.assertEqual(rgb_to_hex(0, 0, 0), "#000000")
         self.assertEqual(rgb_to_hex(255, 255, 255), "#ffffff")
 
+        # 範囲外の値はrgb_to_hex_batchと同様にValueErrorとなる
+        for rgb in [(-1, 0, 0), (0, 256, 0), (0, 0, -255)]:
+            with self.assertRaises(ValueError):
+                rgb_to_hex(*rgb)
+            with self.assertRaises(ValueError):
+                rgb_to_hex_batch([rgb])
+
+    def test_rgb_to_hex_batch(self):
+        """複数のRGB値の一括変換がrgb_to_hexと一致することを確認"""
+        rgb = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (128, 128, 128), (0, 0, 0), (255, 255, 255)]
+        self.assertEqual(rgb_to_hex_batch(rgb), [rgb_to_hex(*values) for values in rgb])
+        self.assertEqual(rgb_to_hex_batch([]), [])
+
     def test_golden_ratio_generator(self):
         """GoldenRatioColorGeneratorのテスト"""
         generator = GoldenRatioColorGenerator()
 
-        # 5色生成されることを確認
+        # 5色の異なるhex形式の色が生成されることを確認
         colors = generator.generate_colors(5)
-        self.assertEqual(len(colors), 5)
-
-        # すべてhex形式であることを確認
-        for color in colors:
-            self.assertTrue(color.startswith("#"))
-            self.assertEqual(len(color), 7)  # #RRGGBB
-
-        # 異なる色が生成されることを確認
-        self.assertEqual(len(set(colors)), 5)
+        _assert_all_hex(self, colors, 5)
 
         # ColorGeneratorのインスタンスであることを確認
         self.assertIsInstance(generator, ColorGenerator)
@@ -76,17 +160,9 @@ class TestColorGenerators(unittest.TestCase):
         """EquidistantColorGeneratorのテスト"""
         generator = EquidistantColorGenerator()
 
-        # 6色生成されることを確認
+        # 6色の異なるhex形式の色が生成されることを確認
         colors = generator.generate_colors(6)
-        self.assertEqual(len(colors), 6)
-
-        # すべてhex形式であることを確認
-        for color in colors:
-            self.assertTrue(color.startswith("#"))
-            self.assertEqual(len(color), 7)
-
-        # 異なる色が生成されることを確認
-        self.assertEqual(len(set(colors)), 6)
+        _assert_all_hex(self, colors, 6)
 
         # ColorGeneratorのインスタンスであることを確認
         self.assertIsInstance(generator, ColorGenerator)
@@ -95,17 +171,9 @@ class TestColorGenerators(unittest.TestCase):
         """FibonacciColorGeneratorのテスト"""
         generator = FibonacciColorGenerator()
 
-        # 8色生成されることを確認
+        # 8色の異なるhex形式の色が生成されることを確認
         colors = generator.generate_colors(8)
-        self.assertEqual(len(colors), 8)
-
-        # すべてhex形式であることを確認
-        for color in colors:
-            self.assertTrue(color.startswith("#"))
-            self.assertEqual(len(color), 7)
-
-        # 異なる色が生成されることを確認
-        self.assertEqual(len(set(colors)), 8)
+        _assert_all_hex(self, colors, 8)
 
         # ColorGeneratorのインスタンスであることを確認
         self.assertIsInstance(generator, ColorGenerator)
@@ -114,17 +182,9 @@ class TestColorGenerators(unittest.TestCase):
         """ColorWheelColorGeneratorのテスト"""
         generator = ColorWheelColorGenerator()
 
-        # 6色生成されることを確認
+        # 6色の異なるhex形式の色が生成されることを確認
         colors = generator.generate_colors(6)
-        self.assertEqual(len(colors), 6)
-
-        # すべてhex形式であることを確認
-        for color in colors:
-            self.assertTrue(color.startswith("#"))
-            self.assertEqual(len(color), 7)
-
-        # 異なる色が生成されることを確認
-        self.assertEqual(len(set(colors)), 6)
+        _assert_all_hex(self, colors, 6)
 
         # ColorGeneratorのインスタンスであることを確認
         self.assertIsInstance(generator, ColorGenerator)
@@ -181,6 +241,34 @@ class TestColorClass(unittest.TestCase):
         # 正しく初期化されることを確認
         self.assertIsInstance(color, Color)
 
+    def test_color_initialization_with_duck_typed_generator(self):
+        """generate_colorsメソッドを持つオブジェクトで初期化できることを確認"""
+
+        class DuckTypedGenerator:
+            def generate_colors(self, n, saturation=0.8, lightness=0.6, offset=0):
+                return ["#000000"] * n
+
+        color = Color(DuckTypedGenerator())
+        self.assertEqual(color.generate(2), ["#000000", "#000000"])
+
+        # generate_colorsメソッドを持たない場合
+        with self.assertRaises(TypeError):
+            Color(object())
+
+    def test_color_initialization_with_class(self):
+        """インスタンス化していないクラスを渡すとTypeErrorになることを確認"""
+        with self.assertRaises(TypeError):
+            Color(GoldenRatioColorGenerator)
+
+    def test_color_initialization_with_function(self):
+        """generate_colorsと同じシグネチャの関数で初期化できることを確認"""
+
+        def generate_gray_colors(n, saturation=0.8, lightness=0.6, offset=0):
+            return ["#808080"] * n
+
+        color = Color(generate_gray_colors)
+        self.assertEqual(color.generate(3), ["#808080", "#808080", "#808080"])
+
     def test_color_generate(self):
         """Colorクラスのgenerateメソッドテスト"""
         golden_generator = GoldenRatioColorGenerator()
@@ -190,10 +278,7 @@ class TestColorClass(unittest.TestCase):
         colors = color.generate(5)
 
         # 正しく生成されることを確認
-        self.assertEqual(len(colors), 5)
-        for color_hex in colors:
-            self.assertTrue(color_hex.startswith("#"))
-            self.assertEqual(len(color_hex), 7)
+        _assert_all_hex(self, colors, 5)
 
     def test_color_with_different_generators(self):
         """異なる生成器を使用したColorクラスのテスト"""
@@ -212,9 +297,8 @@ class TestColorClass(unittest.TestCase):
             self.assertEqual(len(colors), 5)
 
         # すべて異なる結果であることを確認
-        for i in range(len(results)):
-            for j in range(i + 1, len(results)):
-                self.assertNotEqual(results[i], results[j])
+        for colors1, colors2 in itertools.combinations(results, 2):
+            self.assertNotEqual(colors1, colors2)
 
     def test_color_parameters(self):
         """Colorクラスのパラメータテスト"""
@@ -244,11 +328,8 @@ class TestColorClass(unittest.TestCase):
         for generator in color_generators:
             color = Color(generator)
             colors = color.generate(3)
-            self.assertEqual(len(colors), 3)
             self.assertIsInstance(colors, list)
-            for color_hex in colors:
-                self.assertIsInstance(color_hex, str)
-                self.assertTrue(color_hex.startswith("#"))
+            _assert_all_hex(self, colors, 3)
 
 
 class TestColorConsistency(unittest.TestCase):
@@ -269,12 +350,233 @@ class TestColorConsistency(unittest.TestCase):
         color_wheel = ColorWheelColorGenerator().generate_colors(10)
 
         # すべて異なることを確認
-        self.assertNotEqual(golden, equidistant)
-        self.assertNotEqual(golden, fibonacci)
-        self.assertNotEqual(golden, color_wheel)
-        self.assertNotEqual(equidistant, fibonacci)
-        self.assertNotEqual(equidistant, color_wheel)
-        self.assertNotEqual(fibonacci, color_wheel)
+        for colors1, colors2 in itertools.combinations([golden, equidistant, fibonacci, color_wheel], 2):
+            self.assertNotEqual(colors1, colors2)
+
+    def test_shared_generator_instances(self):
+        """共有インスタンスが新しく作成したインスタンスと同じ色を生成することを確認"""
+        self.assertIsInstance(GOLDEN_RATIO_GENERATOR, GoldenRatioColorGenerator)
+        self.assertEqual(GOLDEN_RATIO_GENERATOR.generate_colors(6), GoldenRatioColorGenerator().generate_colors(6))
+        self.assertEqual(Color(FIBONACCI_GENERATOR).generate(6), FibonacciColorGenerator().generate_colors(6))
+
+    def test_cache_is_shared_across_instances(self):
+        """同じクラスの別インスタンス間で生成結果のキャッシュが共有されることを確認"""
+        colors1 = FibonacciColorGenerator().generate_colors(9, 0.7, 0.4, 15, as_tuple=True)
+        colors2 = FibonacciColorGenerator().generate_colors(9, 0.7, 0.4, 15, as_tuple=True)
+        self.assertIs(colors1, colors2)
+
+    def test_cache_distinguishes_generator_attributes(self):
+        """属性の異なる色生成器の生成結果がキャッシュで混同されないことを確認"""
+
+        class CustomRatioGenerator(GoldenRatioColorGenerator):
+            def __init__(self, ratio):
+                self.golden_ratio = ratio
+
+        self.assertNotEqual(
+            CustomRatioGenerator(0.1).generate_colors(7, 0.7), CustomRatioGenerator(0.2).generate_colors(7, 0.7)
+        )
+
+        # インスタンスの属性を変更した場合
+        generator = GoldenRatioColorGenerator()
+        expected = generator.generate_colors(7, 0.7)
+        generator.golden_ratio = 0.3
+        self.assertNotEqual(generator.generate_colors(7, 0.7), expected)
+        self.assertEqual(GoldenRatioColorGenerator().generate_colors(7, 0.7), expected)
+
+        # クラス属性を変更した場合
+        expected = ColorWheelColorGenerator().generate_colors(6)
+        original_hues = ColorWheelColorGenerator.base_hues
+        ColorWheelColorGenerator.base_hues = (30, 90, 150, 210, 270, 330)
+        try:
+            colors = ColorWheelColorGenerator().generate_colors(6)
+        finally:
+            ColorWheelColorGenerator.base_hues = original_hues
+        self.assertNotEqual(colors, expected)
+        self.assertEqual(ColorWheelColorGenerator().generate_colors(6), expected)
+
+        # ハッシュ化できない属性値の場合はキャッシュせずに生成する
+        generator = ColorWheelColorGenerator()
+        generator.base_hues = [30, 90, 150, 210, 270, 330]
+        self.assertEqual(generator.generate_colors(6), colors)
+
+    def test_cache_evicts_least_recently_used(self):
+        """保持する色の総数が上限を超えると、最も長く使われていない結果から破棄されることを確認"""
+        computed = []
+
+        class CountingGenerator(ColorGenerator):
+            @_memoize_palette()
+            def generate_colors(self, n, saturation=0.8, lightness=0.6, offset=0, as_tuple=False, return_format="hex"):
+                computed.append((n, saturation))
+                return tuple(["#000000"] * n)
+
+        generate = CountingGenerator().generate_colors
+        with mock.patch("src.color_generators._PALETTE_CACHE_COLORS", 10):
+            for saturation in (0.5, 0.6, 0.7):
+                generate(3, saturation)
+            # 0.5 を使うことで、最も長く使われていない結果は 0.6 になる
+            generate(3, 0.5)
+            self.assertEqual(computed, [(3, 0.5), (3, 0.6), (3, 0.7)])
+
+            # 4つ目で上限の10色を超えるため、0.6 のみが破棄される
+            generate(3, 0.9)
+            generate(3, 0.5)
+            generate(3, 0.7)
+            self.assertEqual(len(computed), 4)
+            generate(3, 0.6)
+            self.assertEqual(computed[-1], (3, 0.6))
+
+            # 1つで上限を超える生成結果はキャッシュしない
+            generate(11, 0.5)
+            generate(11, 0.5)
+            self.assertEqual(computed[-2:], [(11, 0.5), (11, 0.5)])
+
+            # cache_clear() でキャッシュを空にできる
+            CountingGenerator.generate_colors.cache_clear()
+            generate(3, 0.5)
+            self.assertEqual(computed[-1], (3, 0.5))
+
+    def test_cache_counts_concurrent_misses_once(self):
+        """2つのスレッドが同じキーを同時に生成しても、色の総数が二重に数えられないことを確認"""
+        computed = []
+        barrier = threading.Barrier(2)
+
+        class SlowGenerator(ColorGenerator):
+            @_memoize_palette()
+            def generate_colors(self, n, saturation=0.8, lightness=0.6, offset=0, as_tuple=False, return_format="hex"):
+                computed.append((n, saturation))
+                if len(computed) <= 2:
+                    # 両方のスレッドがキャッシュを参照し終えてから生成結果を追加させる
+                    barrier.wait(timeout=5)
+                return tuple(["#000000"] * n)
+
+        generate = SlowGenerator().generate_colors
+        with mock.patch("src.color_generators._PALETTE_CACHE_COLORS", 10):
+            threads = [threading.Thread(target=generate, args=(7, 0.5)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(computed, [(7, 0.5), (7, 0.5)])
+
+            # 7色が1回だけ数えられていれば、3色を追加しても上限の10色に収まり破棄されない
+            generate(3, 0.5)
+            generate(7, 0.5)
+            self.assertEqual(computed[-1], (3, 0.5))
+
+            # 同じキーの参照を複数のスレッドから繰り返しても、再計算も破棄も起きない
+            # スレッドの切り替えを頻繁にし、参照の途中で別のスレッドが割り込む機会を増やす
+            threads = [threading.Thread(target=lambda: [generate(n, 0.5) for n in (7, 3) * 10000]) for _ in range(4)]
+            interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+            try:
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            finally:
+                sys.setswitchinterval(interval)
+            self.assertEqual(len(computed), 3)
+
+    @mock.patch.dict(_RATIO_HUE_SEQUENCES, clear=True)
+    def test_ratio_hue_sequences_are_bounded(self):
+        """比率ごとに保持する色相の列の長さと比率の数が上限を超えないことを確認"""
+        # 保持している列はモジュール全体で共有されるため、空の状態から始めてテスト後に元に戻す
+        ratio = 0.123
+        n = _RATIO_HUE_MAX_LENGTH + 100
+        self.assertEqual(_ratio_hues(n, ratio), [((i * ratio) % 1.0) * 360 for i in range(n)])
+        self.assertLessEqual(len(_RATIO_HUE_SEQUENCES.get(ratio, ())), _RATIO_HUE_MAX_LENGTH)
+
+        for i in range(_RATIO_HUE_MAX_RATIOS + 1):
+            ratio = 0.2 + i / 1000
+            self.assertEqual(_ratio_hues(3, ratio), [((j * ratio) % 1.0) * 360 for j in range(3)])
+        self.assertLessEqual(len(_RATIO_HUE_SEQUENCES), _RATIO_HUE_MAX_RATIOS)
+
+        # 比率の数が上限に達していても、組み込みの色生成器の比率は保持する
+        for ratio in (GoldenRatioColorGenerator.golden_ratio, FibonacciColorGenerator.fibonacci_ratio):
+            _ratio_hues(3, ratio)
+        self.assertIn(GoldenRatioColorGenerator.golden_ratio, _RATIO_HUE_SEQUENCES)
+        self.assertIn(FibonacciColorGenerator.fibonacci_ratio, _RATIO_HUE_SEQUENCES)
+
+    def test_cached_result_is_not_shared(self):
+        """戻り値を変更しても次回以降の生成結果に影響しないことを確認"""
+        colors1 = GoldenRatioColorGenerator().generate_colors(5)
+        expected = list(colors1)
+        colors1[0] = "#000000"
+        colors1.append("#ffffff")
+
+        colors2 = GoldenRatioColorGenerator().generate_colors(5)
+        self.assertEqual(colors2, expected)
+        self.assertIsNot(colors1, colors2)
+
+    def test_as_tuple(self):
+        """as_tuple=Trueでタプルとして同じ色が返されることを確認"""
+        generators = [
+            GoldenRatioColorGenerator(),
+            EquidistantColorGenerator(),
+            FibonacciColorGenerator(),
+            ColorWheelColorGenerator(),
+        ]
+
+        for generator in generators:
+            colors = generator.generate_colors(7, as_tuple=True)
+            self.assertIsInstance(colors, tuple)
+            self.assertEqual(list(colors), generator.generate_colors(7))
+
+            # Colorクラスからも追加の引数を指定できる
+            self.assertEqual(Color(generator).generate(7, as_tuple=True), colors)
+
+    def test_return_format(self):
+        """return_formatで指定した形式の色が返されることを確認"""
+        generators = [
+            GoldenRatioColorGenerator(),
+            EquidistantColorGenerator(),
+            FibonacciColorGenerator(),
+            ColorWheelColorGenerator(),
+            AlternatingColorGenerator(),
+        ]
+
+        for generator in generators:
+            hex_colors = generator.generate_colors(9, 0.7, 0.5, 10)
+            rgb_colors = generator.generate_colors(9, 0.7, 0.5, 10, return_format="rgb")
+            rgba_colors = generator.generate_colors(9, 0.7, 0.5, 10, return_format="rgba")
+
+            self.assertEqual([rgb_to_hex(*rgb) for rgb in rgb_colors], hex_colors)
+            self.assertEqual(rgba_colors, [rgb + (255,) for rgb in rgb_colors])
+
+            with self.assertRaises(ValueError):
+                generator.generate_colors(9, return_format="hsl")
+
+    def test_batch_conversion_matches_scalar(self):
+        """一括変換の結果がhsl_to_rgb/rgb_to_hexによる変換と一致することを確認"""
+        n = 12
+        for saturation, lightness, offset in [(0.8, 0.6, 0), (1.0, 0.5, 45), (0.3, 0.2, 300), (0.8, 0.6, 7.5)]:
+            expected = [rgb_to_hex(*hsl_to_rgb((i / n) * 360 + offset, saturation, lightness)) for i in range(n)]
+            colors = EquidistantColorGenerator().generate_colors(n, saturation, lightness, offset)
+            self.assertEqual(colors, expected)
+
+    def test_equidistant_matches_scalar_for_non_divisor_sizes(self):
+        """360の約数でない色数でも、等間隔の色相が (i / n) * 360 による変換と一致することを確認"""
+        self.assertEqual(EquidistantColorGenerator().generate_colors(17, 0.5, 0.5, 30)[11], "#7140bf")
+        for n in (7, 11, 13, 17, 23, 29, 97):
+            for saturation, lightness, offset in [(0.5, 0.5, 30), (0.8, 0.6, 0), (0.3, 0.7, 359.5), (1.0, 0.4, -45)]:
+                expected = [rgb_to_hex(*hsl_to_rgb((i / n) * 360 + offset, saturation, lightness)) for i in range(n)]
+                colors = EquidistantColorGenerator().generate_colors(n, saturation, lightness, offset)
+                self.assertEqual(colors, expected)
+
+    def test_large_palettes_match_scalar(self):
+        """並列版のカーネルを使用する色数でも、hsl_to_rgb/rgb_to_hexによる変換と一致することを確認"""
+        n = _PARALLEL_THRESHOLD
+        hues = [(i / n) * 360 + 0.5 for i in range(n)]
+        expected = [hsl_to_rgb(hue, 0.7, 0.45) for hue in hues]
+
+        self.assertEqual(hsl_to_rgb_vec(hues, 0.7, 0.45), expected)
+        colors = EquidistantColorGenerator().generate_colors(n, 0.7, 0.45, 0.5)
+        self.assertEqual(colors, [rgb_to_hex(*rgb) for rgb in expected])
+
+        # 色ごとに彩度・明度が異なる場合
+        generator = AlternatingColorGenerator()
+        rgb_colors = generator.generate_colors(n, 0.7, 0.45, return_format="rgb")
+        self.assertEqual(generator.generate_colors(n, 0.7, 0.45), [rgb_to_hex(*rgb) for rgb in rgb_colors])
 
 
 class TestFlexibility(unittest.TestCase):
@@ -298,9 +600,8 @@ class TestFlexibility(unittest.TestCase):
             self.assertEqual(len(colors), 5)
 
         # すべて異なる結果であることを確認
-        for i in range(len(results)):
-            for j in range(i + 1, len(results)):
-                self.assertNotEqual(results[i], results[j])
+        for colors1, colors2 in itertools.combinations(results, 2):
+            self.assertNotEqual(colors1, colors2)
 
     def test_custom_algorithm(self):
         """カスタムアルゴリズムの実装テスト"""
@@ -335,6 +636,22 @@ class TestFlexibility(unittest.TestCase):
         custom_colors = custom_color.generate(5)
         self.assertEqual(len(custom_colors), 5)
 
+    def test_custom_algorithm_with_batch_conversion(self):
+        """一括変換関数を使ったカスタムアルゴリズムが1色ずつの変換と同じ結果になることを確認"""
+
+        class BatchColorGenerator(ColorGenerator):
+            def generate_colors(self, n, saturation=0.8, lightness=0.6, offset=0):
+                if n <= 0:
+                    raise ValueError("色の数は1以上である必要があります")
+
+                hues = [((i * 0.3) % 360 + offset) % 360 for i in range(n)]  # カスタム計算
+                return rgb_to_hex_batch(hsl_to_rgb_vec(hues, saturation, lightness))
+
+        colors = BatchColorGenerator().generate_colors(5, offset=10)
+        expected = [rgb_to_hex(*hsl_to_rgb(((i * 0.3) % 360 + 10) % 360, 0.8, 0.6)) for i in range(5)]
+        self.assertEqual(colors, expected)
+        self.assertEqual(Color(BatchColorGenerator()).generate(5, offset=10), expected)
+
 
 if __name__ == "__main__":
     # テストの実行